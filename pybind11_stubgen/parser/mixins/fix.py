@@ -3,6 +3,7 @@ from __future__ import annotations
 import builtins
 import importlib
 import inspect
+import itertools
 import re
 import sys
 import types
@@ -38,6 +39,8 @@ from pybind11_stubgen.typing_ext import DynamicSize, FixedSize
 
 logger = getLogger("pybind11_stubgen")
 
+_builtin_names: frozenset[str] = frozenset(dir(builtins))
+
 
 class RemoveSelfAnnotation(IParser):
 
@@ -86,8 +89,14 @@ class FixMissingImports(IParser):
     def __init__(self):
         super().__init__()
         self.__extra_imports: set[Import] = set()
-        self.__current_module: types.ModuleType | None = None
-        self.__current_class: type | None = None
+        # names already resolved to one of `self.__extra_imports`
+        self.__imported_names: set[QualifiedName] = set()
+        # `dir()` is what `inspect.getmembers` walks, so it matches the
+        # set of names that end up in the stubs
+        self.__current_module_names: frozenset[str] = frozenset()
+        self.__current_class_names: frozenset[str] = frozenset()
+        self.__modules: dict[QualifiedName, types.ModuleType | None] = {}
+        self.__parent_modules: dict[QualifiedName, QualifiedName | None] = {}
 
     def handle_alias(self, path: QualifiedName, origin: Any) -> Alias | None:
         result = super().handle_alias(path, origin)
@@ -105,10 +114,10 @@ class FixMissingImports(IParser):
         return result
 
     def handle_class(self, path: QualifiedName, class_: type) -> Class | None:
-        old_class = self.__current_class
-        self.__current_class = class_
+        old_class_names = self.__current_class_names
+        self.__current_class_names = frozenset(dir(class_))
         result = super().handle_class(path, class_)
-        self.__current_class = old_class
+        self.__current_class_names = old_class_names
         return result
 
     def handle_import(self, path: QualifiedName, origin: Any) -> Import | None:
@@ -122,19 +131,22 @@ class FixMissingImports(IParser):
         self, path: QualifiedName, module: types.ModuleType
     ) -> Module | None:
         old_imports = self.__extra_imports
-        old_module = self.__current_module
+        old_imported_names = self.__imported_names
+        old_module_names = self.__current_module_names
         self.__extra_imports = set()
-        self.__current_module = module
+        self.__imported_names = set()
+        self.__current_module_names = frozenset(dir(module))
         result = super().handle_module(path, module)
         if result is not None:
             result.imports |= self.__extra_imports
         self.__extra_imports = old_imports
-        self.__current_module = old_module
+        self.__imported_names = old_imported_names
+        self.__current_module_names = old_module_names
         return result
 
     def handle_type(self, type_: type) -> QualifiedName:
         result = super().handle_type(type_)
-        if not inspect.ismodule(type_):
+        if not isinstance(type_, types.ModuleType):
             self._add_import(result)
         return result
 
@@ -153,44 +165,63 @@ class FixMissingImports(IParser):
         return result
 
     def _add_import(self, name: QualifiedName) -> None:
+        if name in self.__imported_names:
+            return
         if len(name) == 0:
             return
         if len(name) == 1 and len(name[0]) == 0:
             return
-        if hasattr(builtins, name[0]):
+        if name[0] in _builtin_names:
             return
-        if self.__current_class is not None and hasattr(self.__current_class, name[0]):
+        if name[0] in self.__current_class_names:
             return
-        if self.__current_module is not None and hasattr(
-            self.__current_module, name[0]
-        ):
+        if name[0] in self.__current_module_names:
             return
         module_name = self._get_parent_module(name)
         if module_name is None:
             self.report_error(NameResolutionError(name))
             return
         self.__extra_imports.add(Import(name=None, origin=module_name))
+        self.__imported_names.add(name)
 
     def _get_parent_module(self, name: QualifiedName) -> QualifiedName | None:
-        parent = name.parent
-        while len(parent) != 0:
+        try:
+            return self.__parent_modules[name]
+        except KeyError:
+            pass
+        result = None
+        # probe prefixes from the longest one, slicing `name` directly
+        # instead of walking the `.parent` chain
+        for end in range(len(name) - 1, 0, -1):
+            parent = QualifiedName(name[:end])
             if self._is_module(parent):
-                if not self._is_accessible(name, from_module=parent):
-                    return None
-                return parent
-            parent = parent.parent
-        return None
+                if self._is_accessible(name, from_module=parent):
+                    result = parent
+                break
+        self.__parent_modules[name] = result
+        return result
 
-    def _is_module(self, name: QualifiedName):
+    def _import_module(self, name: QualifiedName) -> types.ModuleType | None:
         try:
-            return importlib.import_module(str(name)) is not None
-        except ModuleNotFoundError:
-            return False
+            return self.__modules[name]
+        except KeyError:
+            pass
+        module_name = str(name)
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = importlib.import_module(module_name)
+            except ModuleNotFoundError:
+                module = None
+        self.__modules[name] = module
+        return module
+
+    def _is_module(self, name: QualifiedName) -> bool:
+        return self._import_module(name) is not None
 
     def _is_accessible(self, name: QualifiedName, from_module: QualifiedName) -> bool:
-        try:
-            parent = importlib.import_module(str(from_module))
-        except ModuleNotFoundError:
+        parent = self._import_module(from_module)
+        if parent is None:
             return False
         relative_path = name[len(from_module) :]
         for part in relative_path:
@@ -230,26 +261,25 @@ class FixMissing__all__Attribute(IParser):
                 return result
 
         all_names: list[str] = sorted(
-            set(
-                filter(
-                    lambda name: not name.startswith("_"),
-                    map(
-                        str,
+            {
+                name
+                for name in map(
+                    str,
+                    itertools.chain(
+                        (class_.name for class_ in result.classes),
+                        (attr.name for attr in result.attributes),
+                        (func.name for func in result.functions),
+                        (alias.name for alias in result.aliases),
                         (
-                            *(class_.name for class_ in result.classes),
-                            *(attr.name for attr in result.attributes),
-                            *(func.name for func in result.functions),
-                            *(alias.name for alias in result.aliases),
-                            *(
-                                import_.name
-                                for import_ in result.imports
-                                if import_.name is not None
-                            ),
-                            *(sub_module.name for sub_module in result.sub_modules),
+                            import_.name
+                            for import_ in result.imports
+                            if import_.name is not None
                         ),
+                        (sub_module.name for sub_module in result.sub_modules),
                     ),
                 )
-            )
+                if not name.startswith("_")
+            }
         )
 
         result.attributes.append(
@@ -265,8 +295,22 @@ class FixMissing__all__Attribute(IParser):
 
 class FixBuiltinTypes(IParser):
     _any_type = QualifiedName.from_str("typing.Any")
+    # Precomputed results for types exposed by `builtins`, which make up
+    # most of the `handle_type` calls
+    _builtin_types: dict[type, QualifiedName] = {
+        **{
+            obj: QualifiedName.from_str(obj.__qualname__)
+            for obj in vars(builtins).values()
+            if isinstance(obj, type) and obj.__module__ == "builtins"
+        },
+        type(None): QualifiedName.from_str("None"),
+    }
 
     def handle_type(self, type_: type) -> QualifiedName:
+        builtin_type = self._builtin_types.get(type_)
+        if builtin_type is not None:
+            return builtin_type
+
         if type_.__qualname__ == "PyCapsule" and type_.__module__ == "builtins":
             return self._any_type
 
@@ -313,8 +357,8 @@ class FixMissingNoneHashFieldAnnotation(IParser):
 
 
 class FixPEP585CollectionNames(IParser):
-    __typing_collection_names: set[Identifier] = set(
-        Identifier(name)
+    __typing_collection_names: dict[Identifier, QualifiedName] = {
+        Identifier(name): QualifiedName.from_str(name.lower())
         for name in (
             "Dict",
             "List",
@@ -323,7 +367,7 @@ class FixPEP585CollectionNames(IParser):
             "FrozenSet",
             "Type",
         )
-    )
+    }
 
     def parse_annotation_str(
         self, annotation_str: str
@@ -336,55 +380,61 @@ class FixPEP585CollectionNames(IParser):
         ):
             return result
 
-        word = result.name[1]
-        if word in self.__typing_collection_names:
-            result.name = QualifiedName.from_str(f"{word.lower()}")
+        new_name = self.__typing_collection_names.get(result.name[1])
+        if new_name is not None:
+            result.name = new_name
 
         return result
 
 
 class FixTypingTypeNames(IParser):
-    __typing_names: set[Identifier] = set(
-        Identifier(name)
-        for name in (
-            "Annotated",
-            "Any",
-            "Buffer",
-            "Callable",
-            "Dict",
-            "ItemsView",
-            "Iterable",
-            "Iterator",
-            "KeysView",
-            "List",
-            "Literal",
-            "Optional",
-            "Sequence",
-            "Set",
-            "Tuple",
-            "Union",
-            "ValuesView",
-            # Old pybind11 annotations were not capitalized
-            "buffer",
-            "iterable",
-            "iterator",
-            "sequence",
+    __typing_names: dict[Identifier, QualifiedName] = {
+        Identifier(name): QualifiedName.from_str(
+            f"{package}.{name[0].upper()}{name[1:]}"
         )
-    )
-    __typing_extensions_names: set[Identifier] = set(
-        Identifier(name)
-        for name in (
-            "buffer",
-            "Buffer",
+        for package, names in (
+            (
+                "typing",
+                (
+                    "Annotated",
+                    "Any",
+                    "Buffer",
+                    "Callable",
+                    "Dict",
+                    "ItemsView",
+                    "Iterable",
+                    "Iterator",
+                    "KeysView",
+                    "List",
+                    "Literal",
+                    "Optional",
+                    "Sequence",
+                    "Set",
+                    "Tuple",
+                    "Union",
+                    "ValuesView",
+                    # Old pybind11 annotations were not capitalized
+                    "buffer",
+                    "iterable",
+                    "iterator",
+                    "sequence",
+                ),
+            ),
+            # Entries below override the `typing` ones above
+            (
+                "typing_extensions",
+                (
+                    "buffer",
+                    "Buffer",
+                    *(("Annotated",) if sys.version_info < (3, 9) else ()),
+                    *(("Literal",) if sys.version_info < (3, 8) else ()),
+                ),
+            ),
         )
-    )
-
-    def __init__(self):
-        super().__init__()
-        if sys.version_info < (3, 9):
-            self.__typing_extensions_names.add(Identifier("Annotated"))
-        if sys.version_info < (3, 8):
-            self.__typing_extensions_names.add(Identifier("Literal"))
+        for name in names
+    }
+    __callable_name = QualifiedName.from_str("typing.Callable")
+    __any_name = QualifiedName.from_str("typing.Any")
 
     def parse_annotation_str(
         self, annotation_str: str
@@ -408,17 +458,13 @@ class FixTypingTypeNames(IParser):
             return result
 
         word = result.name[0]
-        if word in self.__typing_names:
-            package = "typing"
-            if word in self.__typing_extensions_names:
-                package = "typing_extensions"
-            result.name = QualifiedName.from_str(
-                f"{package}.{word[0].upper()}{word[1:]}"
-            )
+        new_name = self.__typing_names.get(word)
+        if new_name is not None:
+            result.name = new_name
         if word == "function" and result.parameters is None:
-            result.name = QualifiedName.from_str("typing.Callable")
+            result.name = self.__callable_name
         if word in ("object", "handle") and result.parameters is None:
-            result.name = QualifiedName.from_str("typing.Any")
+            result.name = self.__any_name
 
         return result
 
@@ -473,8 +519,13 @@ class FixCurrentModulePrefixInTypeNames(IParser):
         return result
 
     def _strip_current_module(self, name: QualifiedName) -> QualifiedName:
-        if name[: len(self.__current_module)] == self.__current_module:
-            return QualifiedName(name[len(self.__current_module) :])
+        current_module = self.__current_module
+        prefix_len = len(current_module)
+        # reject mismatches before slicing, most names are not prefixed
+        if prefix_len == 0 or len(name) < prefix_len or name[0] != current_module[0]:
+            return name
+        if name[:prefix_len] == current_module:
+            return QualifiedName(name[prefix_len:])
         return name
 
 
@@ -493,7 +544,9 @@ class FixValueReprRandomAddress(IParser):
 
     def handle_value(self, value: Any) -> Value:
         result = super().handle_value(value)
-        result.repr = self._pattern.sub(r"<\g<name> object>", result.repr)
+        # cheap substring check rules out most reprs before running the regex
+        if " at 0x" in result.repr:
+            result.repr = self._pattern.sub(r"<\g<name> object>", result.repr)
         return result
 
 
@@ -530,6 +583,19 @@ class FixNumpyArrayDimAnnotation(IParser):
 
     __DIM_VARS = ["n", "m"]
 
+    def __init__(self):
+        super().__init__()
+        self.__imported_size_helpers: set[type] = set()
+
+    def handle_module(
+        self, path: QualifiedName, module: types.ModuleType
+    ) -> Module | None:
+        old_imported = self.__imported_size_helpers
+        self.__imported_size_helpers = set()
+        result = super().handle_module(path, module)
+        self.__imported_size_helpers = old_imported
+        return result
+
     def parse_annotation_str(
         self, annotation_str: str
     ) -> ResolvedType | InvalidExpression | Value:
@@ -586,8 +652,10 @@ class FixNumpyArrayDimAnnotation(IParser):
             return_t = DynamicSize
 
         # TRICK: Use `self.handle_type` to make `FixedSize`/`DynamicSize`
-        #        properly added to the list of imports
-        self.handle_type(return_t)
+        #        properly added to the list of imports (once per module)
+        if return_t not in self.__imported_size_helpers:
+            self.handle_type(return_t)
+            self.__imported_size_helpers.add(return_t)
         return return_t(*dims)  # type: ignore[arg-type]
 
     def __to_dims(
@@ -828,14 +896,18 @@ class FixNumpyArrayFlags(IParser):
 
 
 class FixRedundantMethodsFromBuiltinObject(IParser):
+    _object_init_doc = object.__init__.__doc__
+
     def handle_method(self, path: QualifiedName, method: Any) -> list[Method]:
         result = super().handle_method(path, method)
+        if not any(m.function.name == "__init__" for m in result):
+            return result
         return [
             m
             for m in result
             if not (
                 m.function.name == "__init__"
-                and m.function.doc == object.__init__.__doc__
+                and m.function.doc == self._object_init_doc
             )
         ]
 
@@ -866,29 +938,41 @@ class ReplaceReadWritePropertyWithField(IParser):
 
 
 class FixMissingFixedSizeImport(IParser):
+    _fixed_size_pattern = re.compile(r"FixedSize\((?P<dims>[\d\s,]+)\)")
+
+    def __init__(self):
+        super().__init__()
+        self.__fixed_size_imported = False
+
+    def handle_module(
+        self, path: QualifiedName, module: types.ModuleType
+    ) -> Module | None:
+        old_imported = self.__fixed_size_imported
+        self.__fixed_size_imported = False
+        result = super().handle_module(path, module)
+        self.__fixed_size_imported = old_imported
+        return result
+
     def parse_annotation_str(
         self, annotation_str: str
     ) -> ResolvedType | InvalidExpression | Value:
         # Accommodate to
         # https://github.com/pybind/pybind11/pull/4679
         result = super().parse_annotation_str(annotation_str)
-        if (
-            isinstance(result, Value)
-            and result.repr.startswith("FixedSize(")
-            and result.repr.endswith(")")
-        ):
-            try:
-                dimensions = map(
-                    int,
-                    result.repr[len("FixedSize(") : -len(")")].split(","),
-                )
-            except ValueError:
-                pass
-            else:
-                # call `handle_type` to trigger implicit import
-                self.handle_type(FixedSize)
-                return self.handle_value(FixedSize(*dimensions))
-        return result
+        if not isinstance(result, Value):
+            return result
+        match = self._fixed_size_pattern.fullmatch(result.repr)
+        if match is None:
+            return result
+        try:
+            dimensions = [int(dim) for dim in match.group("dims").split(",")]
+        except ValueError:
+            return result
+        # call `handle_type` to trigger implicit import (once per module)
+        if not self.__fixed_size_imported:
+            self.handle_type(FixedSize)
+            self.__fixed_size_imported = True
+        return self.handle_value(FixedSize(*dimensions))
 
 
 class FixMissingEnumMembersAnnotation(IParser):
@@ -915,35 +999,31 @@ class FixMissingEnumMembersAnnotation(IParser):
     def _guess_dict_type(self, d: dict) -> ResolvedType | None:
         if len(d) == 0:
             return None
-        key_types = set()
-        value_types = set()
-        for key, value in d.items():
-            key_types.add(self.handle_type(type(key)))
-            value_types.add(self.handle_type(type(value)))
-        if len(key_types) == 1:
-            key_type = [ResolvedType(name=t) for t in key_types][0]
-        else:
-            union_t = self.parse_annotation_str("typing.Union")
-            assert isinstance(union_t, ResolvedType)
-            key_type = ResolvedType(
-                name=union_t.name, parameters=[ResolvedType(name=t) for t in key_types]
-            )
-        if len(value_types) == 1:
-            value_type = [ResolvedType(name=t) for t in value_types][0]
-        else:
-            union_t = self.parse_annotation_str("typing.Union")
-            assert isinstance(union_t, ResolvedType)
-            value_type = ResolvedType(
-                name=union_t.name,
-                parameters=[ResolvedType(name=t) for t in value_types],
-            )
-        dict_t = self.parse_annotation_str("typing.Dict")
-        assert isinstance(dict_t, ResolvedType)
+        # enum members are mostly homogeneous: resolve each distinct type once
+        key_types = {self.handle_type(t) for t in {type(key) for key in d}}
+        value_types = {
+            self.handle_type(t) for t in {type(value) for value in d.values()}
+        }
         return ResolvedType(
-            name=dict_t.name,
-            parameters=[key_type, value_type],
+            name=self.__typing_name("typing.Dict"),
+            parameters=[self.__union_of(key_types), self.__union_of(value_types)],
         )
 
+    def __union_of(self, types_: set[QualifiedName]) -> ResolvedType:
+        if len(types_) == 1:
+            return ResolvedType(name=next(iter(types_)))
+        return ResolvedType(
+            name=self.__typing_name("typing.Union"),
+            parameters=[ResolvedType(name=t) for t in types_],
+        )
+
+    def __typing_name(self, annotation_str: str) -> QualifiedName:
+        # resolved through the parser so that later fixes (e.g. PEP 585 names)
+        # and import tracking apply
+        result = self.parse_annotation_str(annotation_str)
+        assert isinstance(result, ResolvedType)
+        return result.name
+
 
 class FixPybind11EnumStrDoc(IParser):
     def handle_class_member(
@@ -451,6 +451,15 @@ class ExtractSignaturesFromPybind11Docstrings(IParser):
     _arg_star_name_regex = re.compile(
         r"^\s*(?P<stars>\*{1,2})?" r"\s*(?P<name>\w+)\s*$"
     )
+    _qual_name_regex = re.compile(
+        r"^\s*(?P<qual_name>([_A-Za-z]\w*)?(\s*\.\s*[_A-Za-z]\w*)*)"
+    )
+
+    def __init__(self):
+        super().__init__()
+        # `_split_str` is a pure function of its arguments, while the same
+        # annotation strings recur throughout a module
+        self.__split_str_cache: dict[tuple[str, str], tuple[str, ...] | None] = {}
 
     def handle_function(self, path: QualifiedName, func: Any) -> list[Function]:
         result = super().handle_function(path, func)
@@ -583,11 +592,8 @@ class ExtractSignaturesFromPybind11Docstrings(IParser):
     def parse_type_str(
         self, annotation_str: str
     ) -> ResolvedType | InvalidExpression | Value:
-        qname_regex = re.compile(
-            r"^\s*(?P<qual_name>([_A-Za-z]\w*)?(\s*\.\s*[_A-Za-z]\w*)*)"
-        )
         annotation_str = annotation_str.strip()
-        match = qname_regex.match(annotation_str)
+        match = self._qual_name_regex.match(annotation_str)
         if match is None:
             return self.parse_value_str(annotation_str)
         qual_name = QualifiedName(
@@ -769,7 +775,15 @@ class ExtractSignaturesFromPybind11Docstrings(IParser):
     def _split_parameters_str(self, param_str: str) -> list[str] | None:
         return self._split_str(param_str, delim=",")
 
-    def _split_str(self, param_str: str, delim: str):
+    def _split_str(self, param_str: str, delim: str) -> list[str] | None:
+        key = (param_str, delim)
+        try:
+            result = self.__split_str_cache[key]
+        except KeyError:
+            result = self.__split_str_cache[key] = self.__split_str(param_str, delim)
+        return list(result) if result is not None else None
+
+    def __split_str(self, param_str: str, delim: str) -> tuple[str, ...] | None:
         result = []
         closing = {"(": ")", "{": "}", "[": "]"}
         stack = []
@@ -803,7 +817,7 @@ class ExtractSignaturesFromPybind11Docstrings(IParser):
             return None
         if param_str[arg_begin:i].strip() != 0:
             add_arg()
-        return result
+        return tuple(result)
 
     def _find_str_end(self, s, start) -> int | None:
         for i in range(start + 1, len(s)):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import sys
 from dataclasses import dataclass
 from dataclasses import field as field_
@@ -39,7 +40,9 @@ class QualifiedName(Tuple[Identifier, ...]):
     """Fully Qualified Name"""
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def from_str(cls, name: str) -> QualifiedName:
+        # Instances are immutable, so equal names can share a single object
         return QualifiedName(Identifier(part) for part in name.split("."))
 
     def __str__(self):
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 
 class FixedSize:
+    __slots__ = ("dim",)
+
     def __init__(self, *dim: int):
         self.dim: tuple[int, ...] = dim
 
@@ -9,11 +11,13 @@ class FixedSize:
         return (
             f"{self.__module__}."
             f"{self.__class__.__qualname__}"
-            f"({', '.join(str(d) for d in self.dim)})"
+            f"({', '.join([str(d) for d in self.dim])})"
         )
 
 
 class DynamicSize:
+    __slots__ = ("dim",)
+
     def __init__(self, *dim: int | str):
         self.dim: tuple[int | str, ...] = dim
 
@@ -21,5 +25,5 @@ class DynamicSize:
         return (
             f"{self.__module__}."
             f"{self.__class__.__qualname__}"
-            f"({', '.join(repr(d) for d in self.dim)})"
+            f"({', '.join([repr(d) for d in self.dim])})"
         )